@@ -4,12 +4,38 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import time
 import os
+import sys
+import locale
+import argparse
 import threading
 
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LANGUAGE = "en"
+
+def available_languages():
+    """Return the language codes that have a message catalog"""
+    return sorted(name[:-5] for name in os.listdir(LOCALE_DIR) if name.endswith(".json"))
+
+def detect_language():
+    """Pick the catalog matching the system locale, falling back to English"""
+    lang = (locale.getlocale()[0] or os.environ.get("LANG", "")).lower()
+    if lang.startswith(("zh", "chinese")):
+        return "cn"
+    return DEFAULT_LANGUAGE
+
+def load_messages(language):
+    """Load the message catalog for a single language"""
+    path = os.path.join(LOCALE_DIR, f"{language}.json")
+    if not os.path.exists(path):
+        path = os.path.join(LOCALE_DIR, f"{DEFAULT_LANGUAGE}.json")
+    with open(path, "r", encoding="utf-8") as catalog:
+        return json.load(catalog)
+
 class RemoteMachineManager:
-    def __init__(self, root):
+    def __init__(self, root, language=None):
         self.root = root
-        self.root.title("ZyloDent Remote Manager")
+        self.messages = load_messages(language or detect_language())
+        self.root.title(self.text("title"))
         self.root.geometry("300x450")
         
         # Add a progress indicator
@@ -21,69 +47,74 @@ class RemoteMachineManager:
         self.operation_in_progress = False
         
         # SSH Connection Frame
-        self.conn_frame = ttk.LabelFrame(self.root, text="SSH Connection", padding="10")
+        self.conn_frame = ttk.LabelFrame(self.root, text=self.text("ssh_connection"), padding="10")
         self.conn_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        ttk.Label(self.conn_frame, text="Host IP:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(self.conn_frame, text=self.text("host_ip")).grid(row=0, column=0, sticky=tk.W)
         self.host_ip = tk.StringVar(value="192.168.1.111")
         ttk.Entry(self.conn_frame, textvariable=self.host_ip).grid(row=0, column=1, sticky=tk.EW)
         
-        ttk.Label(self.conn_frame, text="Username:").grid(row=1, column=0, sticky=tk.W)
+        ttk.Label(self.conn_frame, text=self.text("username")).grid(row=1, column=0, sticky=tk.W)
         self.username = tk.StringVar(value="root")
         ttk.Entry(self.conn_frame, textvariable=self.username).grid(row=1, column=1, sticky=tk.EW)
         
-        ttk.Label(self.conn_frame, text="Password:").grid(row=2, column=0, sticky=tk.W)
+        ttk.Label(self.conn_frame, text=self.text("password")).grid(row=2, column=0, sticky=tk.W)
         self.password = tk.StringVar()
         ttk.Entry(self.conn_frame, textvariable=self.password, show="*").grid(row=2, column=1, sticky=tk.EW)
         
         # Pixel Size Frame
-        self.pixel_frame = ttk.LabelFrame(self.root, text="Pixel Size Configuration", padding="10")
+        self.pixel_frame = ttk.LabelFrame(self.root, text=self.text("pixel_frame"), padding="10")
         self.pixel_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        ttk.Label(self.pixel_frame, text="Pixel Size X:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(self.pixel_frame, text=self.text("pixel_size_x")).grid(row=0, column=0, sticky=tk.W)
         self.pixel_size_x = tk.DoubleVar(value=66.73)
         ttk.Entry(self.pixel_frame, textvariable=self.pixel_size_x).grid(row=0, column=1, sticky=tk.EW)
         
-        ttk.Label(self.pixel_frame, text="Pixel Size Y:").grid(row=1, column=0, sticky=tk.W)
+        ttk.Label(self.pixel_frame, text=self.text("pixel_size_y")).grid(row=1, column=0, sticky=tk.W)
         self.pixel_size_y = tk.DoubleVar(value=66.73)
         ttk.Entry(self.pixel_frame, textvariable=self.pixel_size_y).grid(row=1, column=1, sticky=tk.EW)
         
-        ttk.Button(self.pixel_frame, text="Update Pixel Sizes", command=self.update_pixel_sizes).grid(row=2, column=1, sticky=tk.E)
+        ttk.Button(self.pixel_frame, text=self.text("update_pixel_sizes"), command=self.update_pixel_sizes).grid(row=2, column=1, sticky=tk.E)
         
         # Mask Upload Frame
-        self.mask_frame = ttk.LabelFrame(self.root, text="Mask Image Upload", padding="10")
+        self.mask_frame = ttk.LabelFrame(self.root, text=self.text("mask_frame"), padding="10")
         self.mask_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.mask_file = tk.StringVar()
-        ttk.Label(self.mask_frame, text="Selected File:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(self.mask_frame, text=self.text("selected_file")).grid(row=0, column=0, sticky=tk.W)
         ttk.Label(self.mask_frame, textvariable=self.mask_file).grid(row=0, column=1, sticky=tk.W)
         
-        ttk.Button(self.mask_frame, text="Browse...", command=self.browse_mask_file).grid(row=1, column=0, sticky=tk.W)
-        ttk.Button(self.mask_frame, text="Upload Mask", command=self.upload_mask).grid(row=1, column=1, sticky=tk.E)
+        ttk.Button(self.mask_frame, text=self.text("browse"), command=self.browse_mask_file).grid(row=1, column=0, sticky=tk.W)
+        ttk.Button(self.mask_frame, text=self.text("upload_mask"), command=self.upload_mask).grid(row=1, column=1, sticky=tk.E)
         
         # Power Settings Frame
-        self.power_frame = ttk.LabelFrame(self.root, text="Power Settings", padding="10")
+        self.power_frame = ttk.LabelFrame(self.root, text=self.text("power_frame"), padding="10")
         self.power_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        ttk.Label(self.power_frame, text="Power Value:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(self.power_frame, text=self.text("power_value")).grid(row=0, column=0, sticky=tk.W)
         self.power_value = tk.IntVar(value=1.0)
         ttk.Entry(self.power_frame, textvariable=self.power_value).grid(row=0, column=1, sticky=tk.EW)
         
-        ttk.Button(self.power_frame, text="Update Power Settings", command=self.update_power_settings).grid(row=1, column=1, sticky=tk.E)
+        ttk.Button(self.power_frame, text=self.text("update_power_settings"), command=self.update_power_settings).grid(row=1, column=1, sticky=tk.E)
         
         # Status Bar
-        self.status = tk.StringVar(value="Ready")
+        self.status = tk.StringVar(value=self.text("ready"))
         ttk.Label(self.root, textvariable=self.status, relief=tk.SUNKEN).pack(fill=tk.X, padx=10, pady=5)
         
         # Configure grid weights
         for frame in [self.conn_frame, self.pixel_frame, self.mask_frame, self.power_frame]:
             frame.columnconfigure(1, weight=1)
     
+    def text(self, key, **kwargs):
+        """Look up a message in the loaded catalog and fill in its fields"""
+        message = self.messages[key]
+        return message.format(**kwargs) if kwargs else message
+
     def browse_mask_file(self):
         """Open file dialog to select mask image"""
         filepath = filedialog.askopenfilename(
-            title="Select Mask Image",
-            filetypes=[("PNG Files", "*.png"), ("All Files", "*.*")]
+            title=self.text("select_mask_image"),
+            filetypes=[(self.text("png_files"), "*.png"), (self.text("all_files"), "*.*")]
         )
         if filepath:
             self.mask_file.set(filepath)
@@ -116,7 +147,7 @@ class RemoteMachineManager:
     
     def manage_dent_service(self, ssh, action):
         """Stop or start the dent service with proper waiting"""
-        self.status.set(f"{action.capitalize()}ping dent service...")
+        self.status.set(self.text(f"service_{action}"))
         self.root.update()
         
         self.run_shell_commands(ssh, [f"systemctl {action} dentpro.service"])
@@ -132,19 +163,19 @@ class RemoteMachineManager:
     def run_operation(self, operation_func, *args):
         """Run an operation in a separate thread"""
         if self.operation_in_progress:
-            messagebox.showwarning("Warning", "Another operation is in progress")
+            messagebox.showwarning(self.text("warning"), self.text("operation_busy"))
             return
 
         self.operation_in_progress = True
         self.set_buttons_state('disabled')
-        self.progress_var.set("Operation in progress...")
+        self.progress_var.set(self.text("operation_running"))
         
         def thread_func():
             try:
                 operation_func(*args)
             except Exception as e:
                 error_msg = str(e)  # Capture the error message
-                self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
+                self.root.after(0, lambda: messagebox.showerror(self.text("error"), error_msg))
             finally:
                 self.root.after(0, self.operation_completed)
         
@@ -157,7 +188,7 @@ class RemoteMachineManager:
         self.operation_in_progress = False
         self.set_buttons_state('normal')
         self.progress_var.set("")
-        self.status.set("Ready")
+        self.status.set(self.text("ready"))
 
     def update_pixel_sizes(self):
         """Update pixel sizes in machine.json using SFTP"""
@@ -192,12 +223,13 @@ class RemoteMachineManager:
                 with sftp.open(json_path, 'w') as remote_file:
                     json.dump(config, remote_file, indent=4)
                 
-                self.root.after(0, lambda: self.status.set("Pixel sizes updated successfully!"))
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"Updated pixel sizes to X: {pixel_x}, Y: {pixel_y}"))
+                self.root.after(0, lambda: self.status.set(self.text("pixel_sizes_updated")))
+                self.root.after(0, lambda: messagebox.showinfo(self.text("success"), self.text("pixel_sizes_set", pixel_x=pixel_x, pixel_y=pixel_y)))
             
             except json.JSONDecodeError as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Invalid JSON format: {str(e)}"))
-                self.root.after(0, lambda: self.status.set("Error: Invalid JSON format"))
+                error_msg = self.text("invalid_json", error=e)  # Capture before e is cleared
+                self.root.after(0, lambda: messagebox.showerror(self.text("error"), error_msg))
+                self.root.after(0, lambda: self.status.set(self.text("invalid_json_status")))
             finally:
                 sftp.close()
             
@@ -210,7 +242,7 @@ class RemoteMachineManager:
     def upload_mask(self):
         """Upload mask image with proper renaming using shell commands"""
         if not self.mask_file.get():
-            messagebox.showerror("Error", "Please select a mask file first")
+            messagebox.showerror(self.text("error"), self.text("select_mask_first"))
             return
         
         self.run_operation(self._upload_mask_impl)
@@ -235,16 +267,16 @@ class RemoteMachineManager:
                     self.run_shell_commands(ssh, [
                         f"mv {remote_path} {remote_dir}old_mask2.png"
                     ])
-                    self.root.after(0, lambda: self.status.set("Renamed existing mask to old_mask2.png"))
+                    self.root.after(0, lambda: self.status.set(self.text("mask_renamed")))
                 except FileNotFoundError:
-                    self.root.after(0, lambda: self.status.set("No existing mask found, proceeding with upload"))
+                    self.root.after(0, lambda: self.status.set(self.text("no_existing_mask")))
                 
                 # Upload new mask
-                self.root.after(0, lambda: self.status.set(f"Uploading {os.path.basename(local_path)}..."))
+                self.root.after(0, lambda: self.status.set(self.text("uploading", filename=os.path.basename(local_path))))
                 
                 sftp.put(local_path, remote_path)
-                self.root.after(0, lambda: self.status.set("Mask uploaded successfully!"))
-                self.root.after(0, lambda: messagebox.showinfo("Success", "Mask image uploaded and renamed successfully"))
+                self.root.after(0, lambda: self.status.set(self.text("mask_uploaded")))
+                self.root.after(0, lambda: messagebox.showinfo(self.text("success"), self.text("mask_uploaded_detail")))
             
             finally:
                 sftp.close()
@@ -290,12 +322,13 @@ class RemoteMachineManager:
                 with sftp.open(json_path, 'w') as remote_file:
                     json.dump(config, remote_file, indent=4)
                 
-                self.root.after(0, lambda: self.status.set("Power settings updated successfully!"))
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"All power values set to {power_value}"))
+                self.root.after(0, lambda: self.status.set(self.text("power_updated")))
+                self.root.after(0, lambda: messagebox.showinfo(self.text("success"), self.text("power_set", power_value=power_value)))
             
             except json.JSONDecodeError as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Invalid JSON format: {str(e)}"))
-                self.root.after(0, lambda: self.status.set("Error: Invalid JSON format"))
+                error_msg = self.text("invalid_json", error=e)  # Capture before e is cleared
+                self.root.after(0, lambda: messagebox.showerror(self.text("error"), error_msg))
+                self.root.after(0, lambda: self.status.set(self.text("invalid_json_status")))
             finally:
                 sftp.close()
             
@@ -315,15 +348,24 @@ class RemoteMachineManager:
         password = self.password.get()
 
         if not all([host, username]):
-            raise ValueError("Please fill in all connection fields")
+            raise ValueError(self.text("fill_connection_fields"))
         
-        self.status.set(f"Connecting to {host}...")
+        self.status.set(self.text("connecting", host=host))
         self.root.update()
         
         ssh.connect(host, username=username, password=password, timeout=10)
         return ssh
 
-if __name__ == "__main__":
+def main(language=None, argv=None):
+    """Parse the language flag and start the GUI"""
+    parser = argparse.ArgumentParser(description="ZyloDent Remote Manager")
+    parser.add_argument("--lang", choices=available_languages(), default=language,
+                        help="UI language (defaults to the system locale)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
     root = tk.Tk()
-    app = RemoteMachineManager(root)
-    root.mainloop()
\ No newline at end of file
+    app = RemoteMachineManager(root, args.lang)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()